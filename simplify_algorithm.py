@@ -247,10 +247,7 @@ class Simplify:
         drop_zm_layer = result_drop_zm['OUTPUT']
 
         # Extract the QgsFeature from the vector layer
-        qgs_in_features = []
-        qgs_features = drop_zm_layer.getFeatures()
-        for qgs_feature in qgs_features:
-            qgs_in_features.append(qgs_feature)
+        qgs_in_features = list(drop_zm_layer.getFeatures())
         if len(qgs_in_features) > 1:
             geom_type = qgs_in_features[0].geometry().wkbType()
         else:
@@ -300,6 +297,18 @@ class Simplify:
 
         return farthest_index, farthest_dist
 
+    @staticmethod
+    def filter_bounding_box(qgs_geoms, bbox_predicate):
+        """Returns the geometries for which the bounding box respects a rectangle predicate
+
+        :param: qgs_geoms: List of QgsGeometry to filter
+        :param: bbox_predicate: QgsRectangle method (ex.: intersects, contains) applied on each bounding box
+        :return: Geometries for which the bounding box respects the predicate
+        :rtype: List of QgsGeometry
+        """
+
+        return [qgs_geom for qgs_geom in qgs_geoms if bbox_predicate(qgs_geom.boundingBox())]
+
     __slots__ = ('tolerance', 'validate_structure', 'feedback', 'rb_collection', 'eps', 'rb_results', 'rb_geoms',
                  'gs_features')
 
@@ -401,18 +410,20 @@ class Simplify:
         will always stabilize and exit when there are no more simplification to do.
         """
 
+        rb_geoms = self.rb_geoms
         while True:
             progress_bar_value = 0
             self.rb_results.nbr_pass += 1
-            progress_bar = ProgressBar(self.feedback, len(self.rb_geoms),
+            # Only keep the geometry that are not at simplest form; once simplest a geometry is never processed again
+            rb_geoms = [rb_geom for rb_geom in rb_geoms if not rb_geom.is_simplest]
+            progress_bar = ProgressBar(self.feedback, len(rb_geoms),
                                        "Iteration: {0}".format(self.rb_results.nbr_pass))
             nbr_vertice_deleted = 0
-            for i, rb_geom in enumerate(self.rb_geoms):
+            for i, rb_geom in enumerate(rb_geoms):
                 if self.feedback.isCanceled():
                     break
                 progress_bar.set_value(i)
-                if not rb_geom.is_simplest:  # Only process geometry that are not at simplest form
-                    nbr_vertice_deleted += self.process_line(rb_geom)
+                nbr_vertice_deleted += self.process_line(rb_geom)
 
             self.feedback.pushInfo("Vertice deleted: {0}".format(nbr_vertice_deleted))
 
@@ -423,7 +434,7 @@ class Simplify:
 
         return
 
-    def validate_constraints(self, sim_geom, first, last):
+    def validate_constraints(self, sim_geom, qgs_points, first, last):
         """Validate the spatial relationship in order maintain topological structure
 
         Three distinct spatial relation are tested in order to assure that each bend reduce will continue to maintain
@@ -440,6 +451,7 @@ class Simplify:
         errors.
 
         :param: sim_geom: Geometry used to validate constraints
+        :param: qgs_points: List of QgsPoint of the line; vertices up to last must still be in the geometry
         :param: first: Index of the start vertice of the subline
         :param: last: Index of the last vertice of the subline
         :return: Flag indicating if the spatial constraints are valid for this subline simplification
@@ -448,9 +460,9 @@ class Simplify:
 
         constraints_valid = True
 
-        qgs_points = [sim_geom.qgs_geom.vertexAt(i) for i in range(first, last+1)]
-        qgs_geom_new_subline = QgsGeometry(QgsLineString(qgs_points[0], qgs_points[-1]))
-        qgs_geom_old_subline = QgsGeometry(QgsLineString(qgs_points))
+        qgs_points_subline = qgs_points[first:last+1]
+        qgs_geom_new_subline = QgsGeometry(QgsLineString(qgs_points_subline[0], qgs_points_subline[-1]))
+        qgs_geom_old_subline = QgsGeometry(QgsLineString(qgs_points_subline))
         qgs_geoms_with_itself, qgs_geoms_with_others = \
             self.rb_collection.get_segment_intersect(sim_geom.id, qgs_geom_old_subline.boundingBox(),
                                                      qgs_geom_old_subline)
@@ -458,25 +470,32 @@ class Simplify:
         # First: check if the bend reduce line string is an OGC simple line
         constraints_valid = GeoSimUtil.validate_simplicity(qgs_geoms_with_itself, qgs_geom_new_subline)
 
-        # Second: check that the new line does not intersect with any other line or points
+        # Second: check that the new line does not intersect with any other line or points.  Only geometries with a
+        # bounding box touching the new line can intersect it
         if constraints_valid and len(qgs_geoms_with_others) >= 1:
-            constraints_valid = GeoSimUtil.validate_intersection(qgs_geoms_with_others, qgs_geom_new_subline)
+            qgs_geoms_potential = Simplify.filter_bounding_box(qgs_geoms_with_others,
+                                                               qgs_geom_new_subline.boundingBox().intersects)
+            if qgs_geoms_potential:
+                constraints_valid = GeoSimUtil.validate_intersection(qgs_geoms_potential, qgs_geom_new_subline)
 
         # Third: check that inside the subline to simplify there is no feature completely inside it.  This would cause a
-        # sidedness or relative position error
+        # sidedness or relative position error.  Only geometries with a bounding box inside the bounding box of the
+        # subline can be completely inside it
         if constraints_valid and len(qgs_geoms_with_others) >= 1:
-            qgs_ls_old_subline = QgsLineString(qgs_points)
-            qgs_ls_old_subline.addVertex(qgs_points[0])  # Close the line with the start point
-            qgs_geom_old_subline = QgsGeometry(qgs_ls_old_subline.clone())
+            qgs_geoms_potential = Simplify.filter_bounding_box(qgs_geoms_with_others,
+                                                               qgs_geom_old_subline.boundingBox().contains)
+            qgs_ls_old_subline = qgs_geom_old_subline.constGet().clone()
+            qgs_ls_old_subline.addVertex(qgs_points_subline[0])  # Close the line with the start point
+            qgs_geom_old_subline = QgsGeometry(qgs_ls_old_subline)
 
             # Next two lines used to transform a self intersecting line into a valid MultiPolygon
             qgs_geom_unary = QgsGeometry.unaryUnion([qgs_geom_old_subline])
             qgs_geom_polygonize = QgsGeometry.polygonize([qgs_geom_unary])
 
             if qgs_geom_polygonize.isSimple():
-                constraints_valid = GeoSimUtil.validate_sidedness(qgs_geoms_with_others, qgs_geom_polygonize)
+                constraints_valid = GeoSimUtil.validate_sidedness(qgs_geoms_potential, qgs_geom_polygonize)
             else:
-                print("Polygonize not valid")
+                # Polygonize not valid
                 constraints_valid = False
 
         return constraints_valid
@@ -543,17 +562,17 @@ class Simplify:
             if first + 1 < last:  # The segment to check has only 2 points
                 (farthest_index, farthest_dist) = Simplify.find_farthest_point(qgs_points, first, last)
                 if farthest_dist <= self.tolerance:
-                    if self.validate_constraints(sim_geom, first, last):
+                    # qgs_points is still valid up to last: the sublines are processed from the end of the line to the
+                    # start, so all the vertices deleted so far are after last
+                    if self.validate_constraints(sim_geom, qgs_points, first, last):
                         nbr_vertice_deleted += last - first - 1
                         self.rb_collection.delete_vertex(sim_geom, first + 1, last - 1)
                     else:
                         sim_geom.is_simplest = False  # The line string is not at its simplest form
                         # In case of non respect of spatial constraints split and stack again the sub lines
-                        (farthest_index, farthest_dist) = Simplify.find_farthest_point(qgs_points, first, last)
-                        if farthest_dist <= self.tolerance:
-                            # Stack for the net iteration
-                            stack.append((first, farthest_index))
-                            stack.append((farthest_index, last))
+                        # using the farthest point already calculated for this subline
+                        stack.append((first, farthest_index))
+                        stack.append((farthest_index, last))
                 else:
                     # Stack for the iteration
                     stack.append((first, farthest_index))